@@ -13,6 +13,15 @@ public partial class App : Application
     public static IServiceProvider Services { get; private set; } = null!;
     public static string CurrentTheme { get; set; } = "Dark";
 
+    // Theme name -> resource file; anything not listed uses the dark theme
+    private static readonly Dictionary<string, string> _themeFiles = new()
+    {
+        ["Dark"] = "Themes/RamuneSodaTheme.xaml",
+        ["Light"] = "Themes/RamuneSodaLightTheme.xaml"
+    };
+
+    private static readonly Dictionary<string, ResourceDictionary> _themeDictionaries = new();
+
     public App()
     {
         var services = new ServiceCollection();
@@ -77,25 +86,7 @@ public partial class App : Application
     {
         try
         {
-            CurrentTheme = theme;
-            
-            // System theme detection
-            if (theme == "System")
-            {
-                theme = GetSystemTheme();
-            }
-            
-            var mergedDicts = Resources.MergedDictionaries;
-            mergedDicts.Clear();
-            
-            var themeFile = theme == "Light" 
-                ? "Themes/RamuneSodaLightTheme.xaml" 
-                : "Themes/RamuneSodaTheme.xaml";
-                
-            mergedDicts.Add(new ResourceDictionary 
-            { 
-                Source = new Uri(themeFile, UriKind.Relative) 
-            });
+            SetTheme(theme);
         }
         catch (Exception ex)
         {
@@ -112,25 +103,7 @@ public partial class App : Application
     {
         try
         {
-            CurrentTheme = theme;
-            
-            // System theme detection
-            if (theme == "System")
-            {
-                theme = GetSystemTheme();
-            }
-            
-            var mergedDicts = Current.Resources.MergedDictionaries;
-            mergedDicts.Clear();
-            
-            var themeFile = theme == "Light" 
-                ? "Themes/RamuneSodaLightTheme.xaml" 
-                : "Themes/RamuneSodaTheme.xaml";
-                
-            mergedDicts.Add(new ResourceDictionary 
-            { 
-                Source = new Uri(themeFile, UriKind.Relative) 
-            });
+            SetTheme(theme);
         }
         catch (Exception ex)
         {
@@ -139,6 +112,43 @@ public partial class App : Application
         }
     }
 
+    private static void SetTheme(string theme)
+    {
+        CurrentTheme = theme;
+
+        // System theme detection
+        if (theme == "System")
+        {
+            theme = GetSystemTheme();
+        }
+
+        var themeFile = _themeFiles.GetValueOrDefault(theme, _themeFiles["Dark"]);
+
+        var mergedDicts = Current.Resources.MergedDictionaries;
+
+        // The dictionary merged by App.xaml is reused as-is instead of being parsed a second time
+        if (!_themeDictionaries.ContainsKey(themeFile))
+        {
+            var merged = mergedDicts.FirstOrDefault(d => d.Source?.OriginalString.EndsWith(themeFile) == true);
+            if (merged != null) _themeDictionaries[themeFile] = merged;
+        }
+
+        if (!_themeDictionaries.TryGetValue(themeFile, out var dictionary))
+        {
+            // Parse each theme once; switching back reuses the loaded dictionary
+            dictionary = new ResourceDictionary
+            {
+                Source = new Uri(themeFile, UriKind.Relative)
+            };
+            _themeDictionaries[themeFile] = dictionary;
+        }
+
+        if (mergedDicts.Count == 1 && mergedDicts[0] == dictionary) return;
+
+        mergedDicts.Clear();
+        mergedDicts.Add(dictionary);
+    }
+
     /// <summary>
     /// Windowsのシステムテーマを取得
     /// </summary>
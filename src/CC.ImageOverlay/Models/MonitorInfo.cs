@@ -9,20 +9,45 @@ namespace CC.ImageOverlay.Models;
 public partial record MonitorInfo
 {
     public required IntPtr Handle { get; init; }
-    public required string DeviceName { get; init; }
-    public required Rect Bounds { get; init; }
+    private readonly string _deviceName = "";
+    private readonly Rect _bounds;
+
+    public required string DeviceName
+    {
+        get => _deviceName;
+        init
+        {
+            // DisplayName is read whenever the monitor list is drawn; parse the number once here
+            _deviceName = value;
+            MonitorNumber = int.TryParse(MonitorNumberRegex().Match(value).Value, out var num) ? num : 0;
+        }
+    }
+
+    public required Rect Bounds
+    {
+        get => _bounds;
+        init
+        {
+            // Integer geometry is read on every overlay/preview update; convert it once here
+            _bounds = value;
+            Width = (int)value.Width;
+            Height = (int)value.Height;
+            Left = (int)value.X;
+            Top = (int)value.Y;
+        }
+    }
+
     public required bool IsPrimary { get; init; }
 
-    public int Width => (int)Bounds.Width;
-    public int Height => (int)Bounds.Height;
-    public int Left => (int)Bounds.X;
-    public int Top => (int)Bounds.Y;
+    public int Width { get; private init; }
+    public int Height { get; private init; }
+    public int Left { get; private init; }
+    public int Top { get; private init; }
 
     /// <summary>
     /// ディスプレイ番号を取得（例: \\.\DISPLAY1 → 1）
     /// </summary>
-    private int MonitorNumber => 
-        int.TryParse(MonitorNumberRegex().Match(DeviceName).Value, out var num) ? num : 0;
+    private int MonitorNumber { get; init; }
 
     public string DisplayName => IsPrimary
         ? $"モニター {MonitorNumber} (メイン) - {Width}×{Height}"
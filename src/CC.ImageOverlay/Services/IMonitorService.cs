@@ -7,4 +7,7 @@ public interface IMonitorService
     IEnumerable<MonitorInfo> GetMonitors();
     MonitorInfo? GetPrimaryMonitor();
     MonitorInfo? GetMonitorByDeviceName(string deviceName);
+    void Refresh();
+
+    event EventHandler? MonitorsChanged;
 }
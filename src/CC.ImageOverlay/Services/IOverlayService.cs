@@ -8,6 +8,8 @@ public interface IOverlayService
     bool IsVisible { get; }
     void ShowImageOverlay(string imagePath, double opacity, int width, int height, int x, int y, MonitorInfo monitor);
     void UpdateImageOverlay(string imagePath, double opacity, int width, int height, int x, int y, MonitorInfo monitor);
+    void UpdateImageOpacity(double opacity);
+    Task<(int Width, int Height)?> PreloadImageAsync(string imagePath);
     
     void ShowMemoOverlay(string text, string fontFamily, double fontSize, 
         System.Windows.Media.Color textColor, double textOpacity,
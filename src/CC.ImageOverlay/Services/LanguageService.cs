@@ -7,12 +7,17 @@ public class LanguageService : ILanguageService
 {
     private readonly string _languagesDir;
     private readonly Dictionary<string, LanguageInfo> _languages = new();
-    private JsonDocument? _currentData;
+    // Flattened "a.b.c" -> text per language, built the first time a language is loaded
+    private readonly Dictionary<string, Dictionary<string, string>> _texts = new();
+    private Dictionary<string, string>? _currentTexts;
 
     public string CurrentLanguage { get; private set; } = "ja";
 
+    // Languages are discovered once in the constructor, so the code -> name map never changes
+    private IReadOnlyDictionary<string, string>? _availableLanguages;
+
     public IReadOnlyDictionary<string, string> AvailableLanguages
-        => _languages.ToDictionary(x => x.Key, x => x.Value.Name);
+        => _availableLanguages ??= _languages.ToDictionary(x => x.Key, x => x.Value.Name);
 
     public event EventHandler<string>? LanguageChanged;
 
@@ -21,23 +26,31 @@ public class LanguageService : ILanguageService
         // Resolve absolute path
         _languagesDir = Path.Combine(AppDomain.CurrentDomain.BaseDirectory, languagesDir);
         LoadAvailableLanguages();
-        LoadLanguage(CurrentLanguage);
+
+        // The default language's texts are flattened on first lookup; startup usually loads the saved language first
     }
 
     private void LoadAvailableLanguages()
     {
-        if (!Directory.Exists(_languagesDir))
+        string[] files;
+        try
+        {
+            // Enumerate directly; a missing directory is the only case that needs handling
+            files = Directory.GetFiles(_languagesDir, "*_v2.json");
+        }
+        catch (DirectoryNotFoundException)
         {
             Directory.CreateDirectory(_languagesDir);
             return;
         }
 
-        foreach (var file in Directory.GetFiles(_languagesDir, "*_v2.json"))
+        foreach (var file in files)
         {
             try
             {
-                var json = File.ReadAllText(file);
-                var doc = JsonDocument.Parse(json);
+                // Parse straight from the UTF-8 file instead of decoding it into a string first
+                using var stream = File.OpenRead(file);
+                var doc = JsonDocument.Parse(stream);
                 var meta = doc.RootElement.GetProperty("meta");
                 var code = meta.GetProperty("language_code").GetString()!;
                 var name = meta.GetProperty("language_name").GetString()!;
@@ -52,10 +65,11 @@ public class LanguageService : ILanguageService
 
     public bool LoadLanguage(string languageCode)
     {
-        if (!_languages.TryGetValue(languageCode, out var info))
+        var texts = GetTexts(languageCode);
+        if (texts == null)
             return false;
 
-        _currentData = info.Data;
+        _currentTexts = texts;
         CurrentLanguage = languageCode;
         LanguageChanged?.Invoke(this, languageCode);
         return true;
@@ -63,22 +77,41 @@ public class LanguageService : ILanguageService
 
     public string GetText(string keyPath, string? defaultValue = null)
     {
-        if (_currentData == null)
-            return defaultValue ?? keyPath;
+        var texts = _currentTexts ??= GetTexts(CurrentLanguage);
+        if (texts != null && texts.TryGetValue(keyPath, out var text))
+            return text;
 
-        try
+        return defaultValue ?? keyPath;
+    }
+
+    private Dictionary<string, string>? GetTexts(string languageCode)
+    {
+        if (_texts.TryGetValue(languageCode, out var texts))
+            return texts;
+
+        if (!_languages.TryGetValue(languageCode, out var info))
+            return null;
+
+        texts = new Dictionary<string, string>();
+        FlattenTexts(info.Data.RootElement, null, texts);
+        _texts[languageCode] = texts;
+        return texts;
+    }
+
+    private static void FlattenTexts(JsonElement element, string? prefix, Dictionary<string, string> texts)
+    {
+        foreach (var property in element.EnumerateObject())
         {
-            var element = _currentData.RootElement;
-            foreach (var key in keyPath.Split('.'))
+            var key = prefix == null ? property.Name : prefix + "." + property.Name;
+            switch (property.Value.ValueKind)
             {
-                if (!element.TryGetProperty(key, out element))
-                    return defaultValue ?? keyPath;
+                case JsonValueKind.Object:
+                    FlattenTexts(property.Value, key, texts);
+                    break;
+                case JsonValueKind.String:
+                    texts[key] = property.Value.GetString()!;
+                    break;
             }
-            return element.GetString() ?? defaultValue ?? keyPath;
-        }
-        catch
-        {
-            return defaultValue ?? keyPath;
         }
     }
 
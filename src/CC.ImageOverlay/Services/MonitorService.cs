@@ -1,13 +1,62 @@
 using System.Runtime.InteropServices;
 using System.Windows;
+using Microsoft.Win32;
 using CC.ImageOverlay.Models;
 using CC.ImageOverlay.Infrastructure;
 
 namespace CC.ImageOverlay.Services;
 
-public class MonitorService : IMonitorService
+public class MonitorService : IMonitorService, IDisposable
 {
+    // Snapshot taken on first use; lookups reuse it instead of re-enumerating
+    private IReadOnlyList<MonitorInfo>? _monitors;
+    private Dictionary<string, MonitorInfo>? _monitorsByDeviceName;
+
+    public event EventHandler? MonitorsChanged;
+
+    public MonitorService()
+    {
+        // Monitor layout only changes on display configuration events
+        SystemEvents.DisplaySettingsChanged += OnDisplaySettingsChanged;
+    }
+
+    private void OnDisplaySettingsChanged(object? sender, EventArgs e)
+    {
+        Refresh();
+        MonitorsChanged?.Invoke(this, EventArgs.Empty);
+    }
+
+    public void Refresh()
+    {
+        _monitors = null;
+        _monitorsByDeviceName = null;
+    }
+
+    public void Dispose()
+    {
+        SystemEvents.DisplaySettingsChanged -= OnDisplaySettingsChanged;
+    }
+
     public IEnumerable<MonitorInfo> GetMonitors()
+        => _monitors ??= EnumerateMonitors();
+
+    public MonitorInfo? GetPrimaryMonitor()
+        => GetMonitors().FirstOrDefault(m => m.IsPrimary);
+
+    public MonitorInfo? GetMonitorByDeviceName(string deviceName)
+    {
+        if (_monitorsByDeviceName == null)
+        {
+            _monitorsByDeviceName = new Dictionary<string, MonitorInfo>();
+            foreach (var monitor in GetMonitors())
+            {
+                _monitorsByDeviceName.TryAdd(monitor.DeviceName, monitor);
+            }
+        }
+        return _monitorsByDeviceName.GetValueOrDefault(deviceName);
+    }
+
+    private static List<MonitorInfo> EnumerateMonitors()
     {
         var monitors = new List<MonitorInfo>();
 
@@ -36,10 +85,4 @@ public class MonitorService : IMonitorService
 
         return monitors;
     }
-
-    public MonitorInfo? GetPrimaryMonitor()
-        => GetMonitors().FirstOrDefault(m => m.IsPrimary);
-
-    public MonitorInfo? GetMonitorByDeviceName(string deviceName)
-        => GetMonitors().FirstOrDefault(m => m.DeviceName == deviceName);
 }
@@ -1,4 +1,5 @@
 using System.Windows.Media;
+using System.Windows.Threading;
 using CC.ImageOverlay.Models;
 using CC.ImageOverlay.Views;
 
@@ -6,15 +7,43 @@ namespace CC.ImageOverlay.Services;
 
 public class OverlayService : IOverlayService
 {
+    private readonly IMonitorService _monitorService;
+    private readonly Dispatcher _dispatcher;
     private OverlayWindow? _overlayWindow;
     private MonitorInfo? _currentMonitor;
+    private int _monitorOriginX;
+    private int _monitorOriginY;
+    private (int X, int Y)? _lastAbsolutePosition;
 
     public bool IsVisible => _overlayWindow?.IsVisible ?? false;
 
+    public OverlayService(IMonitorService monitorService)
+    {
+        _monitorService = monitorService;
+        _dispatcher = Dispatcher.CurrentDispatcher;
+        _monitorService.MonitorsChanged += OnMonitorsChanged;
+    }
+
+    private void OnMonitorsChanged(object? sender, EventArgs e)
+    {
+        // Display change notifications are not guaranteed to arrive on the UI thread; the position memo
+        // is only touched there so an in-flight UpdatePosition cannot write back a stale position
+        if (!_dispatcher.CheckAccess())
+        {
+            _dispatcher.InvokeAsync(() => OnMonitorsChanged(sender, e));
+            return;
+        }
+
+        // Windows may have moved the overlay and monitor origins may have shifted; reapply the next position
+        _currentMonitor = null;
+        _lastAbsolutePosition = null;
+        ApplyMaxDecodeSize();
+    }
+
     public void ShowImageOverlay(string imagePath, double opacity, int width, int height, int x, int y, MonitorInfo monitor)
     {
         EnsureWindow();
-        _currentMonitor = monitor;
+        SetMonitor(monitor);
         UpdateImageOverlay(imagePath, opacity, width, height, x, y, monitor);
         _overlayWindow!.Show();
     }
@@ -22,18 +51,29 @@ public class OverlayService : IOverlayService
     public void UpdateImageOverlay(string imagePath, double opacity, int width, int height, int x, int y, MonitorInfo monitor)
     {
         if (_overlayWindow == null) return;
-        _currentMonitor = monitor;
+        SetMonitor(monitor);
         _overlayWindow.SetImageWithSize(imagePath, opacity, width, height);
         UpdatePosition(x, y, monitor);
     }
 
+    public void UpdateImageOpacity(double opacity)
+    {
+        _overlayWindow?.SetImageOpacity(opacity);
+    }
+
+    public Task<(int Width, int Height)?> PreloadImageAsync(string imagePath)
+    {
+        EnsureWindow();
+        return _overlayWindow!.PreloadImageAsync(imagePath);
+    }
+
     public void ShowMemoOverlay(string text, string fontFamily, double fontSize,
         Color textColor, double textOpacity,
         Color bgColor, double bgOpacity,
         int width, int height, int x, int y, MonitorInfo monitor)
     {
         EnsureWindow();
-        _currentMonitor = monitor;
+        SetMonitor(monitor);
         UpdateMemoOverlay(text, fontFamily, fontSize, textColor, textOpacity, bgColor, bgOpacity, width, height, x, y, monitor);
         _overlayWindow!.Show();
     }
@@ -44,7 +84,7 @@ public class OverlayService : IOverlayService
         int width, int height, int x, int y, MonitorInfo monitor)
     {
         if (_overlayWindow == null) return;
-        _currentMonitor = monitor;
+        SetMonitor(monitor);
         _overlayWindow.SetMemo(text, fontFamily, fontSize, textColor, textOpacity, bgColor, bgOpacity, width, height);
         UpdatePosition(x, y, monitor);
     }
@@ -57,8 +97,22 @@ public class OverlayService : IOverlayService
     public void UpdatePosition(int x, int y, MonitorInfo monitor)
     {
         if (_overlayWindow == null) return;
-        _currentMonitor = monitor;
-        _overlayWindow.SetPosition(x + (int)monitor.Bounds.Left, y + (int)monitor.Bounds.Top);
+
+        // Callers off the UI thread (hotkeys, timers, workers) are queued onto the overlay's dispatcher
+        if (!_overlayWindow.Dispatcher.CheckAccess())
+        {
+            _overlayWindow.Dispatcher.InvokeAsync(() => UpdatePosition(x, y, monitor));
+            return;
+        }
+
+        SetMonitor(monitor);
+
+        // Size/opacity/text updates also pass through here; skip the window move when nothing moved
+        var position = (X: _monitorOriginX + x, Y: _monitorOriginY + y);
+        if (position == _lastAbsolutePosition) return;
+        _lastAbsolutePosition = position;
+
+        _overlayWindow.SetPosition(position.X, position.Y);
     }
 
     public void SetClickThrough(bool enable)
@@ -70,6 +124,16 @@ public class OverlayService : IOverlayService
     {
         _overlayWindow?.Close();
         _overlayWindow = null;
+        _lastAbsolutePosition = null;
+    }
+
+    private void SetMonitor(MonitorInfo monitor)
+    {
+        // Cache the origin once per monitor instead of reading Bounds on every move
+        if (ReferenceEquals(monitor, _currentMonitor)) return;
+        _currentMonitor = monitor;
+        _monitorOriginX = monitor.Left;
+        _monitorOriginY = monitor.Top;
     }
 
     private void EnsureWindow()
@@ -77,6 +141,17 @@ public class OverlayService : IOverlayService
         if (_overlayWindow == null)
         {
             _overlayWindow = new OverlayWindow();
+            ApplyMaxDecodeSize();
         }
     }
+
+    private void ApplyMaxDecodeSize()
+    {
+        if (_overlayWindow == null) return;
+
+        // The overlay is never sized past its monitor, so the largest monitor bounds every image shown
+        var monitors = _monitorService.GetMonitors().ToList();
+        if (monitors.Count == 0) return;
+        _overlayWindow.SetMaxDecodeSize(monitors.Max(m => m.Width), monitors.Max(m => m.Height));
+    }
 }
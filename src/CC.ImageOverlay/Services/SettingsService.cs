@@ -1,15 +1,18 @@
 using System.IO;
 using System.Text.Json;
+using System.Windows.Threading;
 using CC.ImageOverlay.Models;
 
 namespace CC.ImageOverlay.Services;
 
-public class SettingsService : ISettingsService
+public class SettingsService : ISettingsService, IDisposable
 {
     private static readonly string SettingsDir = Path.Combine(
         Environment.GetFolderPath(Environment.SpecialFolder.ApplicationData),
         "CC-ImageOverlay");
     private static readonly string SettingsPath = Path.Combine(SettingsDir, "settings.json");
+    // Changes arriving within this window are written together
+    private static readonly TimeSpan SaveDelay = TimeSpan.FromMilliseconds(500);
     
     private readonly JsonSerializerOptions _jsonOptions = new()
     {
@@ -17,18 +20,32 @@ public class SettingsService : ISettingsService
         PropertyNamingPolicy = JsonNamingPolicy.CamelCase
     };
 
+    private bool _settingsDirReady;
+    private bool _isDirty;
+    private readonly DispatcherTimer _saveTimer;
+    private Task _pendingWrite = Task.CompletedTask;
+
     public AppSettings CurrentSettings { get; private set; } = new();
 
+    public SettingsService()
+    {
+        _saveTimer = new DispatcherTimer { Interval = SaveDelay };
+        _saveTimer.Tick += (_, _) => SaveInBackground();
+    }
+
     public void Load()
     {
         try
         {
-            if (File.Exists(SettingsPath))
-            {
-                var json = File.ReadAllText(SettingsPath);
-                CurrentSettings = JsonSerializer.Deserialize<AppSettings>(json, _jsonOptions)
-                    ?? new AppSettings();
-            }
+            // Read directly; a missing file is the first-run case, not an error
+            var json = File.ReadAllText(SettingsPath);
+            CurrentSettings = JsonSerializer.Deserialize<AppSettings>(json, _jsonOptions)
+                ?? new AppSettings();
+            _settingsDirReady = true;
+        }
+        catch (Exception ex) when (ex is FileNotFoundException or DirectoryNotFoundException)
+        {
+            // Keep defaults
         }
         catch
         {
@@ -37,16 +54,42 @@ public class SettingsService : ISettingsService
     }
 
     public void Save()
+    {
+        _saveTimer.Stop();
+        _isDirty = false;
+
+        // Let a background write finish first so the two never interleave
+        _pendingWrite.Wait();
+        Write(CurrentSettings);
+    }
+
+    private void SaveInBackground()
+    {
+        _saveTimer.Stop();
+        _isDirty = false;
+
+        // Settings are immutable records, so the snapshot can be serialized off the UI thread
+        var snapshot = CurrentSettings;
+        var previous = _pendingWrite;
+        _pendingWrite = Task.Run(async () =>
+        {
+            await previous;
+            Write(snapshot);
+        });
+    }
+
+    private void Write(AppSettings settings)
     {
         try
         {
-            // Ensure directory exists
-            if (!Directory.Exists(SettingsDir))
+            // Ensure directory exists (once per session)
+            if (!_settingsDirReady)
             {
                 Directory.CreateDirectory(SettingsDir);
+                _settingsDirReady = true;
             }
 
-            var json = JsonSerializer.Serialize(CurrentSettings, _jsonOptions);
+            var json = JsonSerializer.Serialize(settings, _jsonOptions);
             File.WriteAllText(SettingsPath, json);
         }
         catch
@@ -55,15 +98,33 @@ public class SettingsService : ISettingsService
         }
     }
 
-    public void UpdateLanguage(string language)
+    // The file is written once after changes stop arriving
+    private void Update(Func<AppSettings, AppSettings> update)
     {
-        CurrentSettings = CurrentSettings with { Language = language };
-        Save();
+        var updated = update(CurrentSettings);
+        if (updated == CurrentSettings) return;
+
+        CurrentSettings = updated;
+        _isDirty = true;
+        _saveTimer.Stop();
+        _saveTimer.Start();
     }
 
-    public void UpdateTheme(string theme)
+    private void Flush()
     {
-        CurrentSettings = CurrentSettings with { Theme = theme };
-        Save();
+        if (_isDirty) Save();
     }
+
+    public void Dispose()
+    {
+        // Disposed with the service provider on exit; don't lose the last changes or cut off a background write
+        Flush();
+        _pendingWrite.Wait();
+    }
+
+    public void UpdateLanguage(string language)
+        => Update(s => s with { Language = language });
+
+    public void UpdateTheme(string theme)
+        => Update(s => s with { Theme = theme });
 }
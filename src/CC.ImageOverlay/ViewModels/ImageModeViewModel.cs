@@ -3,6 +3,7 @@ using CommunityToolkit.Mvvm.Input;
 using CC.ImageOverlay.Models;
 using CC.ImageOverlay.Services;
 using Microsoft.Win32;
+using System.Windows.Threading;
 
 namespace CC.ImageOverlay.ViewModels;
 
@@ -53,11 +54,17 @@ public partial class ImageModeViewModel : ViewModelBase
     private int _originalWidth;
     private int _originalHeight;
     private bool _isUpdating;
+    private (int OriginalWidth, int OriginalHeight, int MonitorWidth, int MonitorHeight) _lastScaleRangeKey = (-1, -1, -1, -1);
+    private OpenFileDialog? _openFileDialog;
+    private readonly Dispatcher _dispatcher;
+    private bool _monitorSizeUpdateScheduled;
+    private int _imageSelectionVersion;
 
     public ImageModeViewModel(ILanguageService languageService, IOverlayService overlayService)
     {
         _languageService = languageService;
         _overlayService = overlayService;
+        _dispatcher = Dispatcher.CurrentDispatcher;
         _languageService.LanguageChanged += OnLanguageChanged;
     }
 
@@ -100,39 +107,33 @@ public partial class ImageModeViewModel : ViewModelBase
     [RelayCommand]
     private async Task SelectImage()
     {
-        var dialog = new OpenFileDialog
-        {
-            Filter = _languageService.GetText(
-                "ui_controls.common.file_dialogs.image_files_filter",
-                "画像ファイル (*.png *.jpg *.jpeg *.gif *.bmp)|*.png;*.jpg;*.jpeg;*.gif;*.bmp|すべてのファイル (*.*)|*.*"),
-            Title = _languageService.GetText(
-                "ui_controls.common.file_dialogs.select_image_title",
-                "画像ファイルを選択")
-        };
+        // Reuse one dialog so the shell keeps its folder state between openings
+        var dialog = _openFileDialog ??= CreateOpenFileDialog();
 
         if (dialog.ShowDialog() == true)
         {
-            ImagePath = dialog.FileName;
-            HasImage = true;
-            await LoadImageDimensionsAsync(dialog.FileName);
-            
-            if (_overlayService.IsVisible)
-            {
-                UpdateOverlay(null); // Monitor will be provided by caller or managed centrally
-            }
+            var path = dialog.FileName;
+            var version = ++_imageSelectionVersion;
+
+            // Decode the overlay bitmap off the UI thread; the same read reports the source pixel size.
+            // The new path is published only afterwards, so a visible overlay never decodes it on the UI thread
+            var dimensions = await _overlayService.PreloadImageAsync(path);
+
+            // A newer selection (or a clear) started while this one was loading; don't publish over it
+            if (version != _imageSelectionVersion) return;
+
+            ImagePath = path;
+            ApplyImageDimensions(dimensions);
         }
     }
 
     [RelayCommand]
     private void ClearImage()
     {
+        _imageSelectionVersion++;
         ImagePath = null;
         HasImage = false;
-        ImageWidth = 400;
-        ImageHeight = 300;
-        _originalWidth = 0;
-        _originalHeight = 0;
-        RecalculateMaxScale();
+        ResetImageSize();
         if (_overlayService.IsVisible) _overlayService.Hide();
     }
 
@@ -145,86 +146,125 @@ public partial class ImageModeViewModel : ViewModelBase
         }
         else
         {
-            if (string.IsNullOrEmpty(ImagePath) || monitor == null) return;
+            if (!HasImage || string.IsNullOrEmpty(ImagePath) || monitor == null) return;
             _overlayService.ShowImageOverlay(ImagePath, Opacity / 100.0, ImageWidth, ImageHeight, PositionX, PositionY, monitor);
         }
     }
 
     public void UpdateOverlay(MonitorInfo? monitor)
     {
-        if (!_overlayService.IsVisible || string.IsNullOrEmpty(ImagePath) || monitor == null) return;
+        if (!_overlayService.IsVisible || !HasImage || string.IsNullOrEmpty(ImagePath) || monitor == null) return;
         _overlayService.UpdateImageOverlay(ImagePath, Opacity / 100.0, ImageWidth, ImageHeight, PositionX, PositionY, monitor);
     }
 
-    private async Task LoadImageDimensionsAsync(string path)
+    public void UpdateOverlayOpacity()
     {
-        if (string.IsNullOrEmpty(path)) return;
+        if (!_overlayService.IsVisible || !HasImage) return;
+        _overlayService.UpdateImageOpacity(Opacity / 100.0);
+    }
 
-        try
-        {
-            await Task.Run(() =>
-            {
-                using var stream = new System.IO.FileStream(path, System.IO.FileMode.Open, System.IO.FileAccess.Read);
-                var decoder = System.Windows.Media.Imaging.BitmapDecoder.Create(
-                    stream,
-                    System.Windows.Media.Imaging.BitmapCreateOptions.IgnoreColorProfile,
-                    System.Windows.Media.Imaging.BitmapCacheOption.None);
-
-                var frame = decoder.Frames[0];
-                _originalWidth = frame.PixelWidth;
-                _originalHeight = frame.PixelHeight;
-                AspectRatio = (double)_originalWidth / _originalHeight;
-            });
-
-            // Recalculate max scale based on new image dimensions
-            RecalculateMaxScale();
+    private OpenFileDialog CreateOpenFileDialog()
+    {
+        var dialog = new OpenFileDialog();
+        ApplyOpenFileDialogTexts(dialog);
+        return dialog;
+    }
 
-            // Initial scale calculation if needed
-            UpdateSizeFromScale();
+    private void ApplyOpenFileDialogTexts(OpenFileDialog dialog)
+    {
+        dialog.Filter = _languageService.GetText(
+            "ui_controls.common.file_dialogs.image_files_filter",
+            "画像ファイル (*.png *.jpg *.jpeg *.gif *.bmp)|*.png;*.jpg;*.jpeg;*.gif;*.bmp|すべてのファイル (*.*)|*.*");
+        dialog.Title = _languageService.GetText(
+            "ui_controls.common.file_dialogs.select_image_title",
+            "画像ファイルを選択");
+    }
+
+    private void ApplyImageDimensions((int Width, int Height)? dimensions)
+    {
+        // Bound state is only updated here, back on the UI thread
+        if (dimensions is not { } size)
+        {
+            HasImage = false;
+            ResetImageSize();
+            return;
         }
-        catch
+
+        _originalWidth = size.Width;
+        _originalHeight = size.Height;
+        AspectRatio = (double)_originalWidth / _originalHeight;
+
+        // The full decode succeeded, so the file is known to be usable from here on
+        HasImage = true;
+
+        // Initial scale calculation; this also recomputes the max scale for the new dimensions
+        UpdateSizeFromScale();
+    }
+
+    private void ResetImageSize()
+    {
+        // Set the defaults as one batch; the width handler would otherwise rescale them against the old image
+        _isUpdating = true;
+        try
         {
+            _originalWidth = 0;
+            _originalHeight = 0;
             ImageWidth = 400;
             ImageHeight = 300;
         }
+        finally
+        {
+            _isUpdating = false;
+        }
+
+        RecalculateMaxScale();
     }
 
     private void UpdateSizeFromScale()
     {
         if (_isUpdating || _originalWidth <= 0) return;
         _isUpdating = true;
-        
-        // Recalculate MaxScale if needed (though it should be handled by handlers)
-        RecalculateMaxScale();
-
-        // Ensure Scale is within limits
-        if (Scale > MaxScale)
+        try
         {
-            Scale = MaxScale;
-        }
+            // Callers rely on this to refresh MaxScale before the scale is clamped
+            RecalculateMaxScale();
 
-        var newWidth = Math.Max(50, (int)(_originalWidth * (Scale / 100.0)));
-        var newHeight = Math.Max(50, (int)(_originalHeight * (Scale / 100.0)));
+            // Ensure Scale is within limits
+            if (Scale > MaxScale)
+            {
+                Scale = MaxScale;
+            }
 
-        // Ensure position + size doesn't exceed monitor bounds
-        // Adjust position if necessary to keep image within screen
-        if (PositionX + newWidth > MonitorWidth)
-        {
-            PositionX = Math.Max(0, MonitorWidth - newWidth);
+            var newWidth = Math.Max(50, (int)(_originalWidth * (Scale / 100.0)));
+            var newHeight = Math.Max(50, (int)(_originalHeight * (Scale / 100.0)));
+
+            // Ensure position + size doesn't exceed monitor bounds
+            // Adjust position if necessary to keep image within screen
+            if (PositionX + newWidth > MonitorWidth)
+            {
+                PositionX = Math.Max(0, MonitorWidth - newWidth);
+            }
+            if (PositionY + newHeight > MonitorHeight)
+            {
+                PositionY = Math.Max(0, MonitorHeight - newHeight);
+            }
+
+            ImageWidth = newWidth;
+            ImageHeight = newHeight;
         }
-        if (PositionY + newHeight > MonitorHeight)
+        finally
         {
-            PositionY = Math.Max(0, MonitorHeight - newHeight);
+            _isUpdating = false;
         }
-
-        ImageWidth = newWidth;
-        ImageHeight = newHeight;
-
-        _isUpdating = false;
     }
 
     private void RecalculateMaxScale()
     {
+        // The range only depends on the image and monitor sizes; skip the work when neither changed
+        var key = (_originalWidth, _originalHeight, MonitorWidth, MonitorHeight);
+        if (key == _lastScaleRangeKey) return;
+        _lastScaleRangeKey = key;
+
         if (_originalWidth <= 0 || _originalHeight <= 0)
         {
             MaxScale = 200;
@@ -236,61 +276,70 @@ public partial class ImageModeViewModel : ViewModelBase
         double scaleToFitW = ((double)MonitorWidth / _originalWidth) * 100.0;
         double scaleToFitH = ((double)MonitorHeight / _originalHeight) * 100.0;
         
-        MaxScale = Math.Min(1000.0, Math.Min(scaleToFitW, scaleToFitH));
+        var maxScale = Math.Min(1000.0, Math.Min(scaleToFitW, scaleToFitH));
         
         // Ensure MinScale is also reasonable (don't let it go too low)
-        if (MaxScale < 10) MaxScale = 10;
-
-        // Notify UI that MaxScale changed (in case binding didn't pick it up)
-        OnPropertyChanged(nameof(MaxScale));
+        MaxScale = Math.Max(10, maxScale);
     }
 
     partial void OnImageWidthChanged(int value)
     {
         if (_isUpdating || _originalWidth <= 0) return;
         _isUpdating = true;
-
-        // Clamp width to monitor pixels
-        var clampedWidth = Math.Clamp(value, 50, MonitorWidth);
-        var targetScale = (clampedWidth / (double)_originalWidth) * 100.0;
-        
-        // Ensure height doesn't exceed monitor
-        var targetHeight = (int)(_originalHeight * (targetScale / 100.0));
-        if (targetHeight > MonitorHeight)
+        try
         {
-            targetScale = ((double)MonitorHeight / _originalHeight) * 100.0;
-        }
+            // Clamp width to monitor pixels
+            var clampedWidth = Math.Clamp(value, 50, MonitorWidth);
+            var targetScale = (clampedWidth / (double)_originalWidth) * 100.0;
 
-        Scale = Math.Clamp(targetScale, 10, MaxScale);
-        var newWidth = (int)(_originalWidth * (Scale / 100.0));
-        var newHeight = (int)(_originalHeight * (Scale / 100.0));
+            // Ensure height doesn't exceed monitor
+            var targetHeight = (int)(_originalHeight * (targetScale / 100.0));
+            if (targetHeight > MonitorHeight)
+            {
+                targetScale = ((double)MonitorHeight / _originalHeight) * 100.0;
+            }
 
-        // Adjust position if image would extend beyond screen
-        if (PositionX + newWidth > MonitorWidth)
-        {
-            PositionX = Math.Max(0, MonitorWidth - newWidth);
+            Scale = Math.Clamp(targetScale, 10, MaxScale);
+            var newWidth = (int)(_originalWidth * (Scale / 100.0));
+            var newHeight = (int)(_originalHeight * (Scale / 100.0));
+
+            // Adjust position if image would extend beyond screen
+            if (PositionX + newWidth > MonitorWidth)
+            {
+                PositionX = Math.Max(0, MonitorWidth - newWidth);
+            }
+            if (PositionY + newHeight > MonitorHeight)
+            {
+                PositionY = Math.Max(0, MonitorHeight - newHeight);
+            }
+
+            ImageWidth = newWidth;
+            ImageHeight = newHeight;
         }
-        if (PositionY + newHeight > MonitorHeight)
+        finally
         {
-            PositionY = Math.Max(0, MonitorHeight - newHeight);
+            _isUpdating = false;
         }
+    }
 
-        ImageWidth = newWidth;
-        ImageHeight = newHeight;
+    partial void OnMonitorWidthChanged(int value) => ScheduleMonitorSizeUpdate();
 
-        _isUpdating = false;
-    }
+    partial void OnMonitorHeightChanged(int value) => ScheduleMonitorSizeUpdate();
 
-    partial void OnMonitorWidthChanged(int value)
+    /// <summary>
+    /// Width and height change back to back on a monitor switch; recompute once with both applied
+    /// so the scale isn't clamped against a half-updated monitor size.
+    /// </summary>
+    private void ScheduleMonitorSizeUpdate()
     {
-        RecalculateMaxScale();
-        UpdateSizeFromScale();
-    }
+        if (_monitorSizeUpdateScheduled) return;
+        _monitorSizeUpdateScheduled = true;
 
-    partial void OnMonitorHeightChanged(int value)
-    {
-        RecalculateMaxScale();
-        UpdateSizeFromScale();
+        _dispatcher.InvokeAsync(() =>
+        {
+            _monitorSizeUpdateScheduled = false;
+            UpdateSizeFromScale();
+        });
     }
 
     partial void OnScaleChanged(double value)
@@ -314,5 +363,10 @@ public partial class ImageModeViewModel : ViewModelBase
         OnPropertyChanged(nameof(LabelImagePosition));
         OnPropertyChanged(nameof(LabelMonitor));
         OnPropertyChanged(nameof(SelectedImagePathText));
+
+        if (_openFileDialog != null)
+        {
+            ApplyOpenFileDialogTexts(_openFileDialog);
+        }
     }
 }
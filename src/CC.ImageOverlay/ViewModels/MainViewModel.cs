@@ -3,6 +3,7 @@ using CommunityToolkit.Mvvm.Input;
 using CC.ImageOverlay.Models;
 using CC.ImageOverlay.Services;
 using System.Windows;
+using System.Windows.Threading;
 using System.ComponentModel;
 
 namespace CC.ImageOverlay.ViewModels;
@@ -14,12 +15,56 @@ public partial class MainViewModel : ViewModelBase
     private readonly ISettingsService _settingsService;
     private readonly IOverlayService _overlayService;
 
+    // Coalesces bursts of slider/preview changes into one overlay apply per tick
+    private static readonly TimeSpan OverlayUpdateInterval = TimeSpan.FromMilliseconds(40);
+    // Changes further apart than this are treated as fine-tuning and applied immediately
+    private const long BurstThresholdMs = 50;
+    private readonly DispatcherTimer _overlayUpdateTimer;
+    private long _lastOverlayChangeTicks;
+    private bool _overlayApplyQueued;
+    private bool _isInteractiveChange;
+    private bool _overlayUpdatePending;
+    private bool _isApplyingOverlay;
+
+    // Properties that change what the overlay shows; every other change is ignored by the overlay
+    private static readonly HashSet<string?> ImageOverlayProperties = new()
+    {
+        nameof(ImageModeViewModel.PositionX),
+        nameof(ImageModeViewModel.PositionY),
+        nameof(ImageModeViewModel.ImageWidth),
+        nameof(ImageModeViewModel.ImageHeight),
+        nameof(ImageModeViewModel.ImagePath)
+    };
+
+    private static readonly HashSet<string?> MemoOverlayProperties = new()
+    {
+        nameof(MemoModeViewModel.PositionX),
+        nameof(MemoModeViewModel.PositionY),
+        nameof(MemoModeViewModel.Width),
+        nameof(MemoModeViewModel.Height),
+        nameof(MemoModeViewModel.FontSize),
+        nameof(MemoModeViewModel.FontFamily),
+        nameof(MemoModeViewModel.TextColor),
+        nameof(MemoModeViewModel.BackgroundColor),
+        nameof(MemoModeViewModel.TextOpacity),
+        nameof(MemoModeViewModel.BackgroundOpacity),
+        nameof(MemoModeViewModel.MemoText)
+    };
+
+    // Menu order for the bundled languages; any other language file is listed after them
+    private static readonly string[] LanguageMenuOrder = { "ja", "en", "zh", "ko" };
+
     [ObservableProperty]
     private int _selectedTabIndex;
 
     public ImageModeViewModel ImageMode { get; }
     public MemoModeViewModel MemoMode { get; }
 
+    /// <summary>
+    /// 言語メニューの項目（言語コード → 表示名）
+    /// </summary>
+    public IReadOnlyList<KeyValuePair<string, string>> LanguageOptions { get; }
+
     [ObservableProperty]
     private IReadOnlyList<MonitorInfo> _monitors = Array.Empty<MonitorInfo>();
 
@@ -44,11 +89,21 @@ public partial class MainViewModel : ViewModelBase
         ImageMode = imageMode;
         MemoMode = memoMode;
 
+        LanguageOptions = _languageService.AvailableLanguages
+            .OrderBy(l => GetLanguageMenuIndex(l.Key))
+            .ThenBy(l => l.Value)
+            .ToList();
+
+        _overlayUpdateTimer = new DispatcherTimer { Interval = OverlayUpdateInterval };
+        _overlayUpdateTimer.Tick += OnOverlayUpdateTimerTick;
+
         _languageService.LanguageChanged += OnLanguageChanged;
+        _monitorService.MonitorsChanged += OnMonitorsChanged;
         ImageMode.PropertyChanged += OnImageModePropertyChanged;
         MemoMode.PropertyChanged += OnMemoModePropertyChanged;
 
-        LoadMonitors();
+        // Monitor enumeration isn't needed for the first frame; fill the list once the window has rendered
+        Dispatcher.CurrentDispatcher.InvokeAsync(LoadMonitors, DispatcherPriority.Loaded);
     }
 
     // === Localized Text Properties ===
@@ -87,13 +142,25 @@ public partial class MainViewModel : ViewModelBase
         }
     }
 
+    private static int GetLanguageMenuIndex(string languageCode)
+    {
+        var index = Array.IndexOf(LanguageMenuOrder, languageCode);
+        return index < 0 ? int.MaxValue : index;
+    }
+
     // === Commands ===
 
     [RelayCommand]
     private void LoadMonitors()
     {
+        // Reloading the list always enumerates afresh; other lookups keep using the cached snapshot
+        _monitorService.Refresh();
+
+        var selectedDevice = SelectedMonitor?.DeviceName;
         Monitors = _monitorService.GetMonitors().ToList();
-        SelectedMonitor = Monitors.FirstOrDefault(m => m.IsPrimary) ?? Monitors.FirstOrDefault();
+        SelectedMonitor = (selectedDevice != null ? _monitorService.GetMonitorByDeviceName(selectedDevice) : null)
+            ?? _monitorService.GetPrimaryMonitor()
+            ?? Monitors.FirstOrDefault();
     }
 
     [RelayCommand]
@@ -144,11 +211,23 @@ public partial class MainViewModel : ViewModelBase
             MemoMode.MonitorHeight = value.Height;
         }
 
+        // Goes through the scheduler so the monitor switch and the size recompute it triggers apply once
         if (IsOverlayVisible)
         {
-            if (SelectedTabIndex == 0) ImageMode.UpdateOverlay(value);
-            else MemoMode.UpdateOverlay(value);
+            ScheduleOverlayUpdate();
+        }
+    }
+
+    private void OnMonitorsChanged(object? sender, EventArgs e)
+    {
+        // Display change notifications are not guaranteed to arrive on the UI thread
+        if (!_overlayUpdateTimer.Dispatcher.CheckAccess())
+        {
+            _overlayUpdateTimer.Dispatcher.InvokeAsync(LoadMonitors);
+            return;
         }
+
+        LoadMonitors();
     }
 
     private void OnLanguageChanged(object? sender, string lang)
@@ -188,17 +267,16 @@ public partial class MainViewModel : ViewModelBase
     {
         if (IsOverlayVisible && SelectedTabIndex == 0)
         {
-            var props = new[] { 
-                nameof(ImageModeViewModel.PositionX), 
-                nameof(ImageModeViewModel.PositionY), 
-                nameof(ImageModeViewModel.ImageWidth), 
-                nameof(ImageModeViewModel.ImageHeight), 
-                nameof(ImageModeViewModel.Opacity),
-                nameof(ImageModeViewModel.ImagePath)
-            };
-            if (props.Contains(e.PropertyName))
+            // Opacity is a single property on the overlay; apply it directly, even while a slider is dragged
+            if (e.PropertyName == nameof(ImageModeViewModel.Opacity))
+            {
+                ImageMode.UpdateOverlayOpacity();
+                return;
+            }
+
+            if (ImageOverlayProperties.Contains(e.PropertyName))
             {
-                ImageMode.UpdateOverlay(SelectedMonitor);
+                ScheduleOverlayUpdate();
             }
         }
     }
@@ -207,23 +285,103 @@ public partial class MainViewModel : ViewModelBase
     {
         if (IsOverlayVisible && SelectedTabIndex == 1)
         {
-            var props = new[] { 
-                nameof(MemoModeViewModel.PositionX), 
-                nameof(MemoModeViewModel.PositionY), 
-                nameof(MemoModeViewModel.Width), 
-                nameof(MemoModeViewModel.Height), 
-                nameof(MemoModeViewModel.FontSize),
-                nameof(MemoModeViewModel.FontFamily),
-                nameof(MemoModeViewModel.TextColor),
-                nameof(MemoModeViewModel.BackgroundColor),
-                nameof(MemoModeViewModel.TextOpacity),
-                nameof(MemoModeViewModel.BackgroundOpacity),
-                nameof(MemoModeViewModel.MemoText)
-            };
-            if (props.Contains(e.PropertyName))
+            if (MemoOverlayProperties.Contains(e.PropertyName))
             {
-                MemoMode.UpdateOverlay(SelectedMonitor);
+                ScheduleOverlayUpdate();
             }
         }
     }
+
+    /// <summary>
+    /// オーバーレイ更新を予約（連続した変更はタイマー1回分にまとめる）
+    /// </summary>
+    private void ScheduleOverlayUpdate()
+    {
+        // Nothing on screen to update (the overlay can also be hidden directly, e.g. by clearing the image)
+        if (!_overlayService.IsVisible) return;
+
+        // While a slider thumb is dragged only the preview follows; the overlay is applied on release
+        if (_isInteractiveChange || _isApplyingOverlay)
+        {
+            _overlayUpdatePending = true;
+            return;
+        }
+
+        var now = Environment.TickCount64;
+        var elapsed = now - _lastOverlayChangeTicks;
+        _lastOverlayChangeTicks = now;
+
+        if (_overlayApplyQueued || _overlayUpdateTimer.IsEnabled) return;
+
+        if (elapsed >= BurstThresholdMs)
+        {
+            // Isolated change (e.g. arrow key): apply right after the current batch of property changes
+            _overlayApplyQueued = true;
+            _overlayUpdateTimer.Dispatcher.InvokeAsync(() =>
+            {
+                _overlayApplyQueued = false;
+                ApplyOverlayUpdate();
+            }, DispatcherPriority.Background);
+            return;
+        }
+
+        _overlayUpdateTimer.Start();
+    }
+
+    /// <summary>
+    /// スライダーのドラッグ開始（ドラッグ中はオーバーレイへの反映を保留）
+    /// </summary>
+    public void BeginInteractiveChange()
+    {
+        _isInteractiveChange = true;
+    }
+
+    /// <summary>
+    /// スライダーのドラッグ終了（保留中の変更を即時反映）
+    /// </summary>
+    public void EndInteractiveChange()
+    {
+        _isInteractiveChange = false;
+        if (_overlayUpdatePending)
+        {
+            ApplyOverlayUpdate();
+        }
+    }
+
+    private void OnOverlayUpdateTimerTick(object? sender, EventArgs e)
+    {
+        ApplyOverlayUpdate();
+    }
+
+    private void ApplyOverlayUpdate()
+    {
+        _overlayUpdateTimer.Stop();
+
+        // A request arriving while an apply is running only marks the latest state as pending
+        if (_isApplyingOverlay)
+        {
+            _overlayUpdatePending = true;
+            return;
+        }
+
+        _overlayUpdatePending = false;
+        if (!IsOverlayVisible) return;
+
+        _isApplyingOverlay = true;
+        try
+        {
+            // Apply the latest state once; intermediate values are simply skipped
+            if (SelectedTabIndex == 0) ImageMode.UpdateOverlay(SelectedMonitor);
+            else MemoMode.UpdateOverlay(SelectedMonitor);
+        }
+        finally
+        {
+            _isApplyingOverlay = false;
+        }
+
+        if (_overlayUpdatePending && !_isInteractiveChange)
+        {
+            _overlayUpdateTimer.Dispatcher.InvokeAsync(ApplyOverlayUpdate, DispatcherPriority.Background);
+        }
+    }
 }
@@ -23,9 +23,11 @@ public partial class ColorPickerDialog : Window
         
         Loaded += (s, e) =>
         {
-            _isLoaded = true;
+            // Set up the controls while the handlers are still gated so the preview is computed once
             AlphaSlider.Value = _alpha;
+            AlphaText.Text = _alpha.ToString();
             ColorToHsb(initialColor, out _hue, out _saturation, out _brightness);
+            _isLoaded = true;
             UpdateFromHsb();
         };
     }
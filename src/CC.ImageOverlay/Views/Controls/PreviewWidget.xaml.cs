@@ -2,6 +2,7 @@ using System.ComponentModel;
 using System.Windows;
 using System.Windows.Controls;
 using System.Windows.Input;
+using System.Windows.Threading;
 using Microsoft.Extensions.DependencyInjection;
 
 namespace CC.ImageOverlay.Views.Controls;
@@ -12,7 +13,11 @@ public partial class PreviewWidget : UserControl, INotifyPropertyChanged
 
     private bool _isDragging;
     private bool _isResizing;
+    private bool _overlayRectUpdatePending;
+    private (int X, int Y, int Width, int Height) _shownLabels = (int.MinValue, int.MinValue, int.MinValue, int.MinValue);
     private Point _dragStartPoint;
+    private Services.ILanguageService? _languageService;
+    private string? _textsLanguage;
     private double _overlayStartLeft;
     private double _overlayStartTop;
     private double _overlayStartWidth;
@@ -93,9 +98,11 @@ public partial class PreviewWidget : UserControl, INotifyPropertyChanged
         set => SetValue(AspectRatioProperty, value);
     }
 
-    // Scale factors
-    private double ScaleX => PreviewCanvas.ActualWidth / MonitorWidth;
-    private double ScaleY => PreviewCanvas.ActualHeight / MonitorHeight;
+    // Scale factors, refreshed whenever the overlay rect is laid out (canvas or monitor size changes)
+    private double _scaleX;
+    private double _scaleY;
+    private double ScaleX => _scaleX;
+    private double ScaleY => _scaleY;
 
     public PreviewWidget()
     {
@@ -103,47 +110,48 @@ public partial class PreviewWidget : UserControl, INotifyPropertyChanged
         Loaded += OnLoaded;
         Unloaded += OnUnloaded;
         SizeChanged += OnSizeChanged;
+        IsVisibleChanged += OnIsVisibleChanged;
     }
 
     private void OnLoaded(object sender, RoutedEventArgs e)
     {
         UpdateOverlayRect();
         
-        var languageService = App.Services.GetService<Services.ILanguageService>();
-        if (languageService != null)
+        _languageService ??= App.Services.GetService<Services.ILanguageService>();
+        if (_languageService != null)
         {
-            languageService.LanguageChanged += OnLanguageChanged;
-            UpdateTexts(languageService);
+            _languageService.LanguageChanged += OnLanguageChanged;
+            UpdateTexts();
         }
     }
 
     private void OnUnloaded(object sender, RoutedEventArgs e)
     {
-        var languageService = App.Services.GetService<Services.ILanguageService>();
-        if (languageService != null)
+        if (_languageService != null)
         {
-            languageService.LanguageChanged -= OnLanguageChanged;
+            _languageService.LanguageChanged -= OnLanguageChanged;
         }
     }
 
     private void OnLanguageChanged(object? sender, string e)
     {
-        if (App.Services.GetService<Services.ILanguageService>() is { } service)
-        {
-            UpdateTexts(service);
-        }
+        UpdateTexts();
     }
 
-    private void UpdateTexts(Services.ILanguageService languageService)
+    private void UpdateTexts()
     {
+        // Tab switches unload and reload the widget; the labels only need rewriting for a new language
+        if (_languageService == null || _textsLanguage == _languageService.CurrentLanguage) return;
+        _textsLanguage = _languageService.CurrentLanguage;
+
         if (LabelPositionXPrefix != null)
-            LabelPositionXPrefix.Text = languageService.GetText("ui_controls.common.preview.labels.position_x", "位置: X: ");
+            LabelPositionXPrefix.Text = _languageService.GetText("ui_controls.common.preview.labels.position_x", "位置: X: ");
             
         if (LabelPositionYPrefix != null)
-            LabelPositionYPrefix.Text = languageService.GetText("ui_controls.common.preview.labels.position_y", "  Y: ");
+            LabelPositionYPrefix.Text = _languageService.GetText("ui_controls.common.preview.labels.position_y", "  Y: ");
             
         if (LabelSizePrefix != null)
-            LabelSizePrefix.Text = languageService.GetText("ui_controls.common.preview.labels.size", "  |  サイズ: ");
+            LabelSizePrefix.Text = _languageService.GetText("ui_controls.common.preview.labels.size", "  |  サイズ: ");
     }
 
     private void OnSizeChanged(object sender, SizeChangedEventArgs e)
@@ -151,17 +159,24 @@ public partial class PreviewWidget : UserControl, INotifyPropertyChanged
         UpdateOverlayRect();
     }
 
+    private void OnIsVisibleChanged(object sender, DependencyPropertyChangedEventArgs e)
+    {
+        // Catch up on changes that arrived while hidden (e.g. the other mode's tab)
+        if (IsVisible)
+            InvalidateOverlayRect();
+    }
+
     private static void OnMonitorSizeChanged(DependencyObject d, DependencyPropertyChangedEventArgs e)
     {
         if (d is PreviewWidget widget)
-            widget.UpdateOverlayRect();
+            widget.InvalidateOverlayRect();
     }
 
     private static void OnOverlayPositionChanged(DependencyObject d, DependencyPropertyChangedEventArgs e)
     {
         if (d is PreviewWidget widget)
         {
-            widget.UpdateOverlayRect();
+            widget.InvalidateOverlayRect();
             widget.PropertyChanged?.Invoke(widget, new PropertyChangedEventArgs(e.Property.Name));
         }
     }
@@ -170,21 +185,41 @@ public partial class PreviewWidget : UserControl, INotifyPropertyChanged
     {
         if (d is PreviewWidget widget)
         {
-            widget.UpdateOverlayRect();
+            widget.InvalidateOverlayRect();
             widget.PropertyChanged?.Invoke(widget, new PropertyChangedEventArgs(e.Property.Name));
         }
     }
 
+    /// <summary>
+    /// Schedule a single overlay rect update before the next render.
+    /// X/Y/Width/Height usually change together, so this coalesces them into one layout pass.
+    /// </summary>
+    private void InvalidateOverlayRect()
+    {
+        if (_overlayRectUpdatePending || !IsVisible) return;
+        _overlayRectUpdatePending = true;
+        Dispatcher.InvokeAsync(UpdateOverlayRect, DispatcherPriority.Render);
+    }
+
     private void UpdateOverlayRect()
     {
-        if (PreviewCanvas.ActualWidth <= 0 || PreviewCanvas.ActualHeight <= 0)
+        _overlayRectUpdatePending = false;
+
+        var canvasWidth = PreviewCanvas.ActualWidth;
+        var canvasHeight = PreviewCanvas.ActualHeight;
+        if (canvasWidth <= 0 || canvasHeight <= 0)
             return;
 
+        // Read each dependency property once per pass
+        var overlay = (X: OverlayX, Y: OverlayY, Width: OverlayWidth, Height: OverlayHeight);
+        var scaleX = _scaleX = canvasWidth / MonitorWidth;
+        var scaleY = _scaleY = canvasHeight / MonitorHeight;
+
         // Scale overlay size and position
-        var scaledWidth = OverlayWidth * ScaleX;
-        var scaledHeight = OverlayHeight * ScaleY;
-        var scaledX = OverlayX * ScaleX;
-        var scaledY = OverlayY * ScaleY;
+        var scaledWidth = overlay.Width * scaleX;
+        var scaledHeight = overlay.Height * scaleY;
+        var scaledX = overlay.X * scaleX;
+        var scaledY = overlay.Y * scaleY;
 
         OverlayRect.Width = Math.Max(10, scaledWidth);
         OverlayRect.Height = Math.Max(10, scaledHeight);
@@ -195,10 +230,12 @@ public partial class PreviewWidget : UserControl, INotifyPropertyChanged
         Canvas.SetLeft(ResizeHandle, scaledX + scaledWidth - 6);
         Canvas.SetTop(ResizeHandle, scaledY + scaledHeight - 6);
 
-        // Update text
-        PositionXText.Text = OverlayX.ToString();
-        PositionYText.Text = OverlayY.ToString();
-        SizeText.Text = $"{OverlayWidth}×{OverlayHeight}";
+        // Update text; only format the labels whose values changed (a move leaves the size label alone)
+        if (overlay.X != _shownLabels.X) PositionXText.Text = overlay.X.ToString();
+        if (overlay.Y != _shownLabels.Y) PositionYText.Text = overlay.Y.ToString();
+        if (overlay.Width != _shownLabels.Width || overlay.Height != _shownLabels.Height)
+            SizeText.Text = $"{overlay.Width}×{overlay.Height}";
+        _shownLabels = overlay;
     }
 
     // === Drag for Position ===
@@ -234,15 +271,9 @@ public partial class PreviewWidget : UserControl, INotifyPropertyChanged
         newLeft = Math.Clamp(newLeft, 0, PreviewCanvas.ActualWidth - scaledWidth);
         newTop = Math.Clamp(newTop, 0, PreviewCanvas.ActualHeight - scaledHeight);
 
-        Canvas.SetLeft(OverlayRect, newLeft);
-        Canvas.SetTop(OverlayRect, newTop);
-
-        // Convert back to real coordinates
+        // Convert back to real coordinates; the property callbacks lay out the rect and labels in one pass
         OverlayX = (int)(newLeft / ScaleX);
         OverlayY = (int)(newTop / ScaleY);
-
-        PositionXText.Text = OverlayX.ToString();
-        PositionYText.Text = OverlayY.ToString();
     }
 
     private void PreviewCanvas_MouseLeftButtonUp(object sender, MouseButtonEventArgs e)
@@ -315,7 +346,6 @@ public partial class PreviewWidget : UserControl, INotifyPropertyChanged
         OverlayWidth = newWidth;
         OverlayHeight = newHeight;
 
-        UpdateOverlayRect();
         e.Handled = true;
     }
 
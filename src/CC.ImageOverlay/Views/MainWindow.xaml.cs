@@ -1,4 +1,5 @@
 using System.Windows;
+using System.Windows.Controls.Primitives;
 using System.Windows.Input;
 using System.Windows.Media;
 using CC.ImageOverlay.ViewModels;
@@ -50,6 +51,24 @@ public partial class MainWindow : Window
             _languageService.GetText("menus.help.about", "アプリ情報"), MessageBoxButton.OK, MessageBoxImage.Information);
     }
 
+    // === Slider Drag ===
+
+    private void Slider_DragStarted(object sender, DragStartedEventArgs e)
+    {
+        if (DataContext is MainViewModel vm)
+        {
+            vm.BeginInteractiveChange();
+        }
+    }
+
+    private void Slider_DragCompleted(object sender, DragCompletedEventArgs e)
+    {
+        if (DataContext is MainViewModel vm)
+        {
+            vm.EndInteractiveChange();
+        }
+    }
+
     // === Color Picker ===
 
     private void TextColorPreview_Click(object sender, MouseButtonEventArgs e)
@@ -1,19 +1,42 @@
+using System.IO;
 using System.Windows;
 using System.Windows.Interop;
 using System.Windows.Media;
 using System.Windows.Media.Imaging;
+using System.Windows.Threading;
 using CC.ImageOverlay.Infrastructure;
 
 namespace CC.ImageOverlay.Views;
 
 public partial class OverlayWindow : Window
 {
+    // Decoded pixels kept for reuse; the most recent image is always kept even if it alone exceeds this
+    private const long BitmapCacheBudgetBytes = 64L * 1024 * 1024;
+    private const int ClickThroughStyles = NativeMethods.WS_EX_TRANSPARENT | NativeMethods.WS_EX_LAYERED;
+    private const uint MoveWindowFlags = NativeMethods.SWP_NOSIZE | NativeMethods.SWP_NOZORDER | NativeMethods.SWP_NOACTIVATE;
+    private static readonly TimeSpan HighQualityScalingDelay = TimeSpan.FromMilliseconds(150);
+
     private bool _isClickThrough = true;
+    private IntPtr _hwnd;
+
+    // Most recently used first; size/opacity updates reuse the decoded bitmap instead of reading the file again
+    private readonly List<BitmapCacheEntry> _bitmapCache = new();
+    private long _bitmapCacheBytes;
+
+    // Resizes use cheap scaling while they keep coming and switch to high quality once they settle
+    private readonly DispatcherTimer _highQualityScalingTimer;
+    private (int Width, int Height)? _imageSize;
+    private string? _imagePath;
+    private (int Width, int Height) _maxDecodeSize = (int.MaxValue, int.MaxValue);
 
     public OverlayWindow()
     {
         InitializeComponent();
         Loaded += OnLoaded;
+
+        _highQualityScalingTimer = new DispatcherTimer { Interval = HighQualityScalingDelay };
+        _highQualityScalingTimer.Tick += OnHighQualityScalingTimerTick;
+        RenderOptions.SetBitmapScalingMode(OverlayImage, BitmapScalingMode.HighQuality);
     }
 
     private void OnLoaded(object sender, RoutedEventArgs e)
@@ -31,42 +54,50 @@ public partial class OverlayWindow : Window
         if (hwnd == IntPtr.Zero) return;
 
         var extendedStyle = NativeMethods.GetWindowLong(hwnd, NativeMethods.GWL_EXSTYLE);
+        var newStyle = enable
+            ? extendedStyle | ClickThroughStyles
+            : extendedStyle & ~NativeMethods.WS_EX_TRANSPARENT;
 
-        if (enable)
+        // Changing the extended style makes Windows re-evaluate the frame; skip it when nothing changes
+        if (newStyle != extendedStyle)
         {
-            NativeMethods.SetWindowLong(hwnd, NativeMethods.GWL_EXSTYLE,
-                extendedStyle | NativeMethods.WS_EX_TRANSPARENT | NativeMethods.WS_EX_LAYERED);
-        }
-        else
-        {
-            NativeMethods.SetWindowLong(hwnd, NativeMethods.GWL_EXSTYLE,
-                extendedStyle & ~NativeMethods.WS_EX_TRANSPARENT);
+            NativeMethods.SetWindowLong(hwnd, NativeMethods.GWL_EXSTYLE, newStyle);
         }
     }
 
     /// <summary>
-    /// 画像を設定
+    /// 画像をサイズ指定で設定
     /// </summary>
-    public void SetImage(string imagePath, double opacity, double scale)
+    public void SetImageWithSize(string imagePath, double opacity, int width, int height)
     {
+        // Position-only updates arrive with the image already shown at this size; only the opacity can differ
+        if (imagePath == _imagePath && _imageSize == (width, height) && OverlayImage.Visibility == Visibility.Visible)
+        {
+            OverlayImage.Opacity = opacity;
+            return;
+        }
+
         try
         {
-            var bitmap = new BitmapImage();
-            bitmap.BeginInit();
-            bitmap.UriSource = new Uri(imagePath, UriKind.Absolute);
-            bitmap.CacheOption = BitmapCacheOption.OnLoad;
-            bitmap.EndInit();
-            bitmap.Freeze();
+            var bitmap = GetBitmap(imagePath);
+
+            // The first layout has no previous size and renders in high quality straight away
+            if (_imageSize is { } previous && previous != (width, height))
+            {
+                BeginFastScaling();
+            }
+            _imageSize = (width, height);
 
             OverlayImage.Source = bitmap;
             OverlayImage.Opacity = opacity;
-            OverlayImage.Width = bitmap.PixelWidth * scale;
-            OverlayImage.Height = bitmap.PixelHeight * scale;
+            OverlayImage.Width = width;
+            OverlayImage.Height = height;
             OverlayImage.Visibility = Visibility.Visible;
             MemoContainer.Visibility = Visibility.Collapsed;
 
-            Width = OverlayImage.Width;
-            Height = OverlayImage.Height;
+            Width = width;
+            Height = height;
+            _imagePath = imagePath;
         }
         catch
         {
@@ -75,35 +106,154 @@ public partial class OverlayWindow : Window
     }
 
     /// <summary>
-    /// 画像をサイズ指定で設定
+    /// 画像の透明度のみを設定
     /// </summary>
-    public void SetImageWithSize(string imagePath, double opacity, int width, int height)
+    public void SetImageOpacity(double opacity)
+    {
+        OverlayImage.Opacity = opacity;
+    }
+
+    private void BeginFastScaling()
+    {
+        RenderOptions.SetBitmapScalingMode(OverlayImage, BitmapScalingMode.LowQuality);
+        _highQualityScalingTimer.Stop();
+        _highQualityScalingTimer.Start();
+    }
+
+    private void OnHighQualityScalingTimerTick(object? sender, EventArgs e)
+    {
+        _highQualityScalingTimer.Stop();
+        RenderOptions.SetBitmapScalingMode(OverlayImage, BitmapScalingMode.HighQuality);
+    }
+
+    private BitmapImage GetBitmap(string imagePath)
+    {
+        // A file edited on disk since it was decoded is decoded again instead of showing the old pixels
+        var writeTime = File.GetLastWriteTimeUtc(imagePath);
+        var index = _bitmapCache.FindIndex(entry => entry.Path == imagePath);
+        if (index >= 0)
+        {
+            var hit = _bitmapCache[index];
+            if (hit.WriteTime == writeTime)
+            {
+                if (index > 0)
+                {
+                    _bitmapCache.RemoveAt(index);
+                    _bitmapCache.Insert(0, hit);
+                }
+                return hit.Bitmap;
+            }
+
+            RemoveFromBitmapCache(index);
+        }
+
+        var entry = DecodeBitmap(imagePath, writeTime, _maxDecodeSize);
+        AddToBitmapCache(entry);
+        return entry.Bitmap;
+    }
+
+    /// <summary>
+    /// デコードする最大サイズを設定（これより大きい画像は縮小してデコード）
+    /// </summary>
+    public void SetMaxDecodeSize(int width, int height)
+    {
+        if (_maxDecodeSize == (width, height)) return;
+        _maxDecodeSize = (width, height);
+
+        // Bitmaps decoded against the previous limit may be too small or larger than needed now
+        _bitmapCache.Clear();
+        _bitmapCacheBytes = 0;
+        _imagePath = null;
+    }
+
+    /// <summary>
+    /// 画像をバックグラウンドでデコードしてキャッシュに追加（元画像のピクセルサイズを返し、デコードできなければnull）
+    /// </summary>
+    public async Task<(int Width, int Height)?> PreloadImageAsync(string imagePath)
     {
         try
         {
-            var bitmap = new BitmapImage();
-            bitmap.BeginInit();
-            bitmap.UriSource = new Uri(imagePath, UriKind.Absolute);
-            bitmap.CacheOption = BitmapCacheOption.OnLoad;
-            bitmap.EndInit();
-            bitmap.Freeze();
+            // Selecting a file again is how an edited image gets picked up, so a stale entry is decoded again
+            var writeTime = File.GetLastWriteTimeUtc(imagePath);
+            var index = _bitmapCache.FindIndex(entry => entry.Path == imagePath);
+            if (index >= 0)
+            {
+                var hit = _bitmapCache[index];
+                if (hit.WriteTime == writeTime) return (hit.SourceWidth, hit.SourceHeight);
 
-            OverlayImage.Source = bitmap;
-            OverlayImage.Opacity = opacity;
-            OverlayImage.Width = width;
-            OverlayImage.Height = height;
-            OverlayImage.Visibility = Visibility.Visible;
-            MemoContainer.Visibility = Visibility.Collapsed;
+                RemoveFromBitmapCache(index);
+                if (_imagePath == imagePath) _imagePath = null;
+            }
 
-            Width = width;
-            Height = height;
+            // Frozen bitmaps can be handed from the worker to the UI thread
+            var maxDecodeSize = _maxDecodeSize;
+            var entry = await Task.Run(() => DecodeBitmap(imagePath, writeTime, maxDecodeSize));
+            if (maxDecodeSize == _maxDecodeSize && !_bitmapCache.Exists(cached => cached.Path == imagePath))
+            {
+                AddToBitmapCache(entry);
+            }
+            return (entry.SourceWidth, entry.SourceHeight);
         }
         catch
         {
-            // Handle invalid image path
+            return null;
+        }
+    }
+
+    private void AddToBitmapCache(BitmapCacheEntry entry)
+    {
+        _bitmapCache.Insert(0, entry);
+        _bitmapCacheBytes += GetPixelBytes(entry.Bitmap);
+
+        // Evict least recently used images until the decoded size fits the budget
+        while (_bitmapCacheBytes > BitmapCacheBudgetBytes && _bitmapCache.Count > 1)
+        {
+            RemoveFromBitmapCache(_bitmapCache.Count - 1);
         }
     }
 
+    private void RemoveFromBitmapCache(int index)
+    {
+        _bitmapCacheBytes -= GetPixelBytes(_bitmapCache[index].Bitmap);
+        _bitmapCache.RemoveAt(index);
+    }
+
+    private static long GetPixelBytes(BitmapSource bitmap)
+        => (long)bitmap.PixelWidth * bitmap.PixelHeight * ((bitmap.Format.BitsPerPixel + 7) / 8);
+
+    private static BitmapCacheEntry DecodeBitmap(string imagePath, DateTime writeTime, (int Width, int Height) maxSize)
+    {
+        // One open serves both the header read and the decode
+        using var stream = new FileStream(imagePath, FileMode.Open, FileAccess.Read);
+
+        // The header gives the source size, which also tells whether the image is larger than it can ever be shown
+        var frame = BitmapDecoder.Create(stream, BitmapCreateOptions.IgnoreColorProfile, BitmapCacheOption.None).Frames[0];
+        var pixelWidth = frame.PixelWidth;
+        var pixelHeight = frame.PixelHeight;
+        stream.Position = 0;
+
+        var bitmap = new BitmapImage();
+        bitmap.BeginInit();
+        bitmap.StreamSource = stream;
+        // OnLoad copies the pixels during EndInit, so the stream can be closed afterwards
+        bitmap.CacheOption = BitmapCacheOption.OnLoad;
+
+        // The codec scales while decoding (JPEG at a reduced DCT size), so the full-size pixels are never held;
+        // setting one side keeps the aspect ratio
+        if ((long)pixelWidth * maxSize.Height >= (long)pixelHeight * maxSize.Width)
+        {
+            if (pixelWidth > maxSize.Width) bitmap.DecodePixelWidth = maxSize.Width;
+        }
+        else if (pixelHeight > maxSize.Height)
+        {
+            bitmap.DecodePixelHeight = maxSize.Height;
+        }
+
+        bitmap.EndInit();
+        bitmap.Freeze();
+        return new BitmapCacheEntry(imagePath, writeTime, bitmap, pixelWidth, pixelHeight);
+    }
+
     /// <summary>
     /// メモテキストを設定
     /// </summary>
@@ -112,10 +262,21 @@ public partial class OverlayWindow : Window
         int width = 0, int height = 0)
     {
         MemoText.Text = text;
-        MemoText.FontFamily = new FontFamily(fontFamily);
         MemoText.FontSize = fontSize;
-        MemoText.Foreground = new SolidColorBrush(textColor) { Opacity = textOpacity };
-        MemoContainer.Background = new SolidColorBrush(backgroundColor) { Opacity = bgOpacity };
+
+        // New font/brush instances always count as a change; only replace them when the values differ
+        if (MemoText.FontFamily.Source != fontFamily)
+        {
+            MemoText.FontFamily = new FontFamily(fontFamily);
+        }
+        if (!IsSameBrush(MemoText.Foreground, textColor, textOpacity))
+        {
+            MemoText.Foreground = new SolidColorBrush(textColor) { Opacity = textOpacity };
+        }
+        if (!IsSameBrush(MemoContainer.Background, backgroundColor, bgOpacity))
+        {
+            MemoContainer.Background = new SolidColorBrush(backgroundColor) { Opacity = bgOpacity };
+        }
 
         OverlayImage.Visibility = Visibility.Collapsed;
         MemoContainer.Visibility = Visibility.Visible;
@@ -135,13 +296,26 @@ public partial class OverlayWindow : Window
         }
     }
 
+    private static bool IsSameBrush(Brush? brush, Color color, double opacity)
+        => brush is SolidColorBrush solid && solid.Color == color && solid.Opacity == opacity;
+
     /// <summary>
-    /// 位置を設定
+    /// 位置を設定（Left/Topと同じDIP単位で、1回のネイティブ移動にまとめる）
     /// </summary>
     public void SetPosition(int x, int y)
     {
-        Left = x;
-        Top = y;
+        // Setting Left and Top separately moves the window twice; SetWindowPos does it in one call.
+        // EnsureHandle lets the position be applied before the first Show as well.
+        if (_hwnd == IntPtr.Zero)
+        {
+            _hwnd = new WindowInteropHelper(this).EnsureHandle();
+        }
+
+        // The position is in DIPs like Width/Height; SetWindowPos takes device pixels
+        var transform = PresentationSource.FromVisual(this)?.CompositionTarget?.TransformToDevice ?? Matrix.Identity;
+        var position = transform.Transform(new Point(x, y));
+        NativeMethods.SetWindowPos(_hwnd, IntPtr.Zero,
+            (int)Math.Round(position.X), (int)Math.Round(position.Y), 0, 0, MoveWindowFlags);
     }
 
     /// <summary>
@@ -149,7 +323,9 @@ public partial class OverlayWindow : Window
     /// </summary>
     public void SetMonitorPosition(int monitorLeft, int monitorTop, int overlayX, int overlayY)
     {
-        Left = monitorLeft + overlayX;
-        Top = monitorTop + overlayY;
+        SetPosition(monitorLeft + overlayX, monitorTop + overlayY);
     }
+
+    // The bitmap may be decoded smaller than the file; the source size is what the scale is based on
+    private record BitmapCacheEntry(string Path, DateTime WriteTime, BitmapImage Bitmap, int SourceWidth, int SourceHeight);
 }